@@ -10,18 +10,51 @@ Usage:
     python3 firstbase_validation.py                      # validate all files
     python3 firstbase_validation.py firstbase_json/f.json # validate specific file(s)
     python3 firstbase_validation.py --verbose             # show per-file details
+    python3 firstbase_validation.py --jobs 4              # worker processes (default: CPUs)
     python3 firstbase_validation.py --dump-schema TradeItem  # dump a schema definition
 """
 
+import http.client
 import json
 import os
+import pickle
 import re
 import sys
 import ssl
+import time
+import urllib.error
 import urllib.request
 import collections
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# orjson decodes several times faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# An integer of 19+ digits may not fit in 64 bits. orjson turns those into
+# floats (or rejects them, depending on version) where stdlib json keeps an
+# int, so documents with any 19-digit run are decoded with stdlib json. The
+# check maps all digits to "0" and searches for a run, which is far cheaper
+# than a regex; runs inside strings or fractions only cost the slower decoder.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _loads(data):
+    """Decode JSON bytes, with the same results as stdlib json.loads."""
+    if orjson is None or _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO):
+        return json.loads(data)
+    return orjson.loads(data)
+
+# ijson (optional) lets very large documents be validated incrementally
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 SCHEMAS = {
     "product": {
         "url": "https://test-productapi-firstbase.gs1.ch/docs/v01/productApi",
@@ -37,61 +70,370 @@ SCHEMAS = {
 
 FIRSTBASE_DIR = Path(__file__).parent / "firstbase_json"
 
+# Files above this size are streamed with ijson (if installed)
+STREAM_THRESHOLD = 5 * 1024 * 1024
+
+# Exact Python types a JSON decoder produces per schema type. Checked with
+# type(val) rather than isinstance(), so booleans don't pass as integers.
+TYPE_MAP = {
+    "string": (str,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "array": (list,),
+    "object": (dict,),
+}
+
+# Swagger download: seconds per attempt (overridable via the SWAGGER_TIMEOUT
+# environment variable), and attempts (exponential backoff)
+SWAGGER_TIMEOUT = 30
+SWAGGER_RETRIES = 3
+
 # ── Schema loading ──────────────────────────────────────────────────────────
 
+def _write_pickle(pkl_path, spec):
+    """Best-effort write of the pickled spec next to the JSON cache."""
+    try:
+        with open(pkl_path, "wb") as f:
+            pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def _load_cache(cache_path):
+    """Load a cached spec, preferring the pickle while it is up to date."""
+    pkl_path = cache_path.with_suffix(".pkl")
+    if pkl_path.exists() and pkl_path.stat().st_mtime >= cache_path.stat().st_mtime:
+        try:
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Unpickling a stale or truncated file can raise nearly anything
+            # (AttributeError, ImportError, ValueError...); rebuild from JSON
+            pass
+    with open(cache_path, "rb") as f:
+        spec = _loads(f.read())
+    _write_pickle(pkl_path, spec)
+    return spec
+
+
+def _load_meta(cache_path):
+    """ETag/Last-Modified of the cached spec, if recorded after the cache was written."""
+    meta_path = cache_path.with_suffix(".meta.json")
+    if (cache_path.exists() and meta_path.exists()
+            and meta_path.stat().st_mtime >= cache_path.stat().st_mtime):
+        with open(meta_path, "rb") as f:
+            return _loads(f.read())
+    return {}
+
+
+def _swagger_timeout():
+    """Per-attempt download timeout: SWAGGER_TIMEOUT from the environment, else the default."""
+    value = os.environ.get("SWAGGER_TIMEOUT")
+    if value is None:
+        return SWAGGER_TIMEOUT
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = 0
+    if not 0 < timeout < float("inf"):
+        print(f"WARNING: invalid SWAGGER_TIMEOUT {value!r}, using {SWAGGER_TIMEOUT}s")
+        return SWAGGER_TIMEOUT
+    return timeout
+
+
 def fetch_swagger(schema_key, use_cache=True):
-    """Download and cache a Swagger spec."""
+    """Download and cache a Swagger spec.
+
+    The JSON cache is the canonical copy; a pickle of it (.pkl) is kept
+    alongside and used while it is at least as new, as it loads much faster.
+    With use_cache=False the download is a conditional GET against the
+    cached ETag/Last-Modified (.meta.json), so an unchanged spec costs a 304.
+    """
     info = SCHEMAS[schema_key]
     cache_path = Path(__file__).parent / info["cache"]
 
     if use_cache and cache_path.exists():
-        with open(cache_path) as f:
-            return json.load(f)
+        return _load_cache(cache_path)
+
+    timeout = _swagger_timeout()
+    headers = {"Accept": "application/json"}
+    meta = _load_meta(cache_path)
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
 
     print(f"Downloading {info['label']} from {info['url']} ...")
     ctx = ssl.create_default_context()
-    req = urllib.request.Request(info["url"], headers={"Accept": "application/json"})
-    with urllib.request.urlopen(req, timeout=30, context=ctx) as resp:
-        spec = json.loads(resp.read())
+    req = urllib.request.Request(info["url"], headers=headers)
+    for attempt in range(SWAGGER_RETRIES):
+        try:
+            with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
+                body = resp.read()
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+            break
+        except (http.client.HTTPException, OSError) as e:
+            # OSError covers URLError, timeouts and resets; HTTPException covers
+            # a response cut short while reading (IncompleteRead)
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                print(f"Not modified, using {cache_path}")
+                return _load_cache(cache_path)
+            transient = not isinstance(e, urllib.error.HTTPError) or e.code >= 500
+            if not transient or attempt == SWAGGER_RETRIES - 1:
+                if cache_path.exists():
+                    print(f"  {e} — keeping cached {cache_path}")
+                    return _load_cache(cache_path)
+                raise
+            delay = 2 ** attempt
+            print(f"  {e} — retrying in {delay}s")
+            time.sleep(delay)
+    spec = _loads(body)
 
     with open(cache_path, "w") as f:
         json.dump(spec, f)
+    _write_pickle(cache_path.with_suffix(".pkl"), spec)
+    with open(cache_path.with_suffix(".meta.json"), "w") as f:
+        json.dump({"etag": etag, "last_modified": last_modified}, f)
     print(f"Cached to {cache_path} ({len(spec.get('definitions', {}))} definitions)")
     return spec
 
 
 def build_schema_index(spec):
-    """Build short-name -> full-name lookup, preferring Standard entities."""
+    """Build short-name lookups.
+
+    Returns (index, standard_index): index maps short name -> full name,
+    preferring Standard entities; standard_index maps short name -> all
+    full names containing "Standard".
+    """
     defs = spec["definitions"]
     index = {}
+    standard_index = {}
     for name in defs:
         short = name.split(".")[-1]
-        if "Standard" in name or short not in index:
+        if "Standard" in name:
             index[short] = name
-    return index
+            standard_index.setdefault(short, []).append(name)
+        elif short not in index:
+            index[short] = name
+    return index, standard_index
 
 
 # ── Validation engine ───────────────────────────────────────────────────────
 
+def _enum_summary(values):
+    """Short enum listing for issue messages (first 6 values)."""
+    return f"{values[:6]}{'...' if len(values) > 6 else ''}"
+
+
+def _in_enum(val, enum_set):
+    """Enum membership test that tolerates unhashable JSON values."""
+    try:
+        return val in enum_set
+    except TypeError:
+        return False
+
+
+def _type_mismatch(val, expected, path):
+    """TYPE_MISMATCH issue for a value that failed the schema type check."""
+    if type(val) is bool and expected in ("integer", "number"):
+        return Issue("TYPE_MISMATCH", path, f"expected {expected}, got boolean")
+    return Issue("TYPE_MISMATCH", path, f"expected {expected}, got {type(val).__name__}")
+
+
+def _type_mismatch_expr(types):
+    """Source for a failed TYPE_MAP check, e.g. 'type(val) is not str'."""
+    if len(types) == 1:
+        return f"type(val) is not {types[0].__name__}"
+    return f"type(val) not in ({', '.join(t.__name__ for t in types)})"
+
+
+# Property rule kinds — what the walker does with a property's value
+RULE_SCALAR = 0      # type/enum checks only
+RULE_REF = 1         # $ref object: descend into child_def
+RULE_REF_ENUM = 2    # $ref to an enum definition: check obj["Value"]
+RULE_ARRAY_REF = 3   # array of $ref objects: descend into each item
+RULE_ARRAY_ENUM = 4  # array of $ref enums: check each item (or its "Value")
+
+# A property's schema compiled once into the fields the walker needs
+PropRule = collections.namedtuple("PropRule", [
+    "kind", "type", "expected_types", "enum_set", "enum_msg",
+    "child_def", "child_enum_set", "child_enum_msg",
+])
+
+
 class Validator:
     def __init__(self, spec, label=""):
         self.defs = spec["definitions"]
-        self.index = build_schema_index(spec)
+        self.index, self.standard_index = build_schema_index(spec)
         self.label = label
 
+        # Schema is immutable once loaded — precompute per-definition lookups
+        self._props = {name: d.get("properties", {}) for name, d in self.defs.items()}
+        self._enum = {name: d.get("enum") for name, d in self.defs.items()}
+        self._short = {name: name.split(".")[-1] for name in self.defs}
+        self._def_enum_set = {name: frozenset(e) for name, e in self._enum.items() if e}
+        self._def_enum_msg = {name: _enum_summary(e) for name, e in self._enum.items() if e}
+
+        self._resolve_cache = {}
+        self._compiled = {
+            name: {key: self._compile_prop(prop_spec) for key, prop_spec in props.items()}
+            for name, props in self._props.items()
+        }
+        # Generated per-definition walkers, built on first use
+        self._compiled_fn = {}
+
+    def __getstate__(self):
+        # exec-generated functions don't pickle; workers regenerate them
+        state = self.__dict__.copy()
+        state["_compiled_fn"] = {}
+        return state
+
+    def _compile_prop(self, prop_spec):
+        """Compile one property schema into a PropRule."""
+        expected = prop_spec.get("type")
+        enum = prop_spec.get("enum")
+        kind, child_def = RULE_SCALAR, None
+        if "$ref" in prop_spec:
+            child_def = self.resolve(prop_spec["$ref"])
+            if child_def:
+                kind = RULE_REF_ENUM if child_def in self._def_enum_set else RULE_REF
+        elif expected == "array" and "$ref" in prop_spec.get("items", {}):
+            child_def = self.resolve(prop_spec["items"]["$ref"])
+            if child_def:
+                kind = RULE_ARRAY_ENUM if child_def in self._def_enum_set else RULE_ARRAY_REF
+        return PropRule(
+            kind, expected, TYPE_MAP.get(expected),
+            frozenset(enum) if enum is not None else None,
+            _enum_summary(enum) if enum is not None else None,
+            child_def,
+            self._def_enum_set.get(child_def),
+            self._def_enum_msg.get(child_def),
+        )
+
+    def _compile_definition(self, def_name):
+        """Generate a specialized walker function for one definition.
+
+        The PropRules are partially evaluated: plain typed scalars and plain
+        $ref objects go into lookup tables handled inline by the walker, and
+        every other property gets its own generated handler with its types,
+        enum set and child definition baked in. The walker takes
+        (obj, path, issues, children): it appends issues and queues
+        (obj, definition, path) frames for nested objects.
+        """
+        rules = self._compiled[def_name]
+        namespace = {
+            "Issue": Issue, "_in_enum": _in_enum, "_type_mismatch": _type_mismatch,
+            "_UNKNOWN": object(),
+            "types": {}, "type_names": {}, "refs": {}, "handlers": {},
+        }
+        src = []
+        for n, (key, rule) in enumerate(rules.items()):
+            plain = rule.enum_set is None
+            if plain and rule.kind == RULE_SCALAR and rule.expected_types:
+                namespace["types"][key] = rule.expected_types
+                namespace["type_names"][key] = rule.type
+                continue
+            if plain and rule.kind == RULE_REF and not rule.expected_types:
+                namespace["refs"][key] = rule.child_def
+                continue
+
+            body = []
+            if rule.expected_types:
+                body += [
+                    f"    if {_type_mismatch_expr(rule.expected_types)}:",
+                    f"        issues.append(_type_mismatch(val, {rule.type!r}, path))",
+                ]
+            if rule.enum_set is not None:
+                namespace[f"_E{n}"] = rule.enum_set
+                body += [
+                    f"    if not _in_enum(val, _E{n}):",
+                    f"        issues.append(Issue('INVALID_ENUM', path,",
+                    f"                            f\"'{{val}}' not in \" + {rule.enum_msg!r}))",
+                ]
+            if rule.kind == RULE_REF:
+                body += [
+                    "    if isinstance(val, dict):",
+                    f"        children.append((val, {rule.child_def!r}, path))",
+                ]
+            elif rule.kind == RULE_REF_ENUM:
+                namespace[f"_C{n}"] = rule.child_enum_set
+                body += [
+                    "    if isinstance(val, dict):",
+                    "        inner = val.get('Value')",
+                    f"        if inner is not None and not _in_enum(inner, _C{n}):",
+                    "            issues.append(Issue('INVALID_ENUM', path + '.Value',",
+                    f"                                f\"'{{inner}}' not in \" + {rule.child_enum_msg!r}))",
+                ]
+            elif rule.kind == RULE_ARRAY_REF:
+                body += [
+                    "    if isinstance(val, list):",
+                    "        for i, item in enumerate(val):",
+                    "            if isinstance(item, dict):",
+                    f"                children.append((item, {rule.child_def!r}, f'{{path}}[{{i}}]'))",
+                ]
+            elif rule.kind == RULE_ARRAY_ENUM:
+                namespace[f"_C{n}"] = rule.child_enum_set
+                body += [
+                    "    if isinstance(val, list):",
+                    "        for i, item in enumerate(val):",
+                    "            inner = item.get('Value') if isinstance(item, dict) else item",
+                    f"            if inner is not None and not _in_enum(inner, _C{n}):",
+                    "                issues.append(Issue('INVALID_ENUM', f'{path}[{i}]',",
+                    f"                                    f\"'{{inner}}' not in \" + {rule.child_enum_msg!r}))",
+                ]
+
+            if body:
+                src += [f"def _h{n}(val, path, issues, children):"] + body + [""]
+                src.append(f"handlers[{key!r}] = _h{n}")
+            else:
+                src.append(f"handlers[{key!r}] = None")
+
+        unknown_msg = f"not in '{self._short[def_name]}' (has {len(rules)} properties)"
+        src += [
+            "",
+            "def walk(obj, path, issues, children):",
+            "    for key, val in obj.items():",
+            "        t = types.get(key)",
+            "        if t is not None:",
+            "            if val is not None and type(val) not in t:",
+            "                issues.append(_type_mismatch(val, type_names[key],",
+            "                                             f'{path}.{key}' if path else key))",
+            "            continue",
+            "        child = refs.get(key)",
+            "        if child is not None:",
+            "            if isinstance(val, dict):",
+            "                children.append((val, child, f'{path}.{key}' if path else key))",
+            "            continue",
+            "        check = handlers.get(key, _UNKNOWN)",
+            "        if check is _UNKNOWN:",
+            "            issues.append(Issue('UNKNOWN_FIELD', f'{path}.{key}' if path else key,",
+            f"                                {unknown_msg!r}))",
+            "        elif check is not None and val is not None:",
+            "            check(val, f'{path}.{key}' if path else key, issues, children)",
+        ]
+        exec(compile("\n".join(src), f"<validator {self._short[def_name]}>", "exec"), namespace)
+        fn = self._compiled_fn[def_name] = namespace["walk"]
+        return fn
+
     def resolve(self, ref_or_name):
         """Resolve a $ref string or short name to a full definition name."""
-        name = ref_or_name.replace("#/definitions/", "")
+        if ref_or_name in self._resolve_cache:
+            return self._resolve_cache[ref_or_name]
+        name = ref_or_name.removeprefix("#/definitions/")
         if name in self.defs:
-            return name
-        short = name.split(".")[-1]
-        return self.index.get(short)
+            resolved = name
+        else:
+            resolved = self.index.get(name.split(".")[-1])
+        self._resolve_cache[ref_or_name] = resolved
+        return resolved
 
     def get_props(self, def_name):
-        return self.defs.get(def_name, {}).get("properties", {})
+        return self._props.get(def_name, {})
 
     def get_enum(self, def_name):
-        return self.defs.get(def_name, {}).get("enum")
+        return self._enum.get(def_name)
 
     def validate(self, obj, def_name, path=""):
         """Validate an object against a schema definition. Returns list of issues."""
@@ -101,164 +443,267 @@ class Validator:
             issues.append(Issue("SCHEMA_NOT_FOUND", path, f"'{def_name}' not in spec"))
             return issues
 
-        props = self.get_props(resolved)
         if not isinstance(obj, dict):
             return issues
 
-        # Check for unknown fields
-        allowed = set(props.keys())
-        for key in obj:
-            full_path = f"{path}.{key}" if path else key
-            if key not in allowed:
-                issues.append(Issue("UNKNOWN_FIELD", full_path,
-                                    f"not in '{resolved.split('.')[-1]}' "
-                                    f"(has {len(allowed)} properties)"))
-                continue
-
-            val = obj[key]
-            prop_spec = props[key]
-
-            # Type checks
-            issues.extend(self._check_type(val, prop_spec, full_path))
-
-            # Enum checks (for inline enums)
-            if "enum" in prop_spec and val is not None:
-                if val not in prop_spec["enum"]:
-                    issues.append(Issue("INVALID_ENUM", full_path,
-                                        f"'{val}' not in {prop_spec['enum'][:6]}"
-                                        f"{'...' if len(prop_spec['enum']) > 6 else ''}"))
-
-            # Recurse into $ref objects
-            if "$ref" in prop_spec and isinstance(val, dict):
-                child_def = self.resolve(prop_spec["$ref"])
-                if child_def:
-                    child_enum = self.get_enum(child_def)
-                    if child_enum:
-                        inner = val.get("Value")
-                        if inner is not None and inner not in child_enum:
-                            issues.append(Issue("INVALID_ENUM", f"{full_path}.Value",
-                                                f"'{inner}' not in "
-                                                f"{child_enum[:6]}"
-                                                f"{'...' if len(child_enum) > 6 else ''}"))
-                    else:
-                        issues.extend(self.validate(val, child_def, full_path))
-
-            # Recurse into arrays
-            elif prop_spec.get("type") == "array" and isinstance(val, list):
-                items_spec = prop_spec.get("items", {})
-                if "$ref" in items_spec:
-                    child_def = self.resolve(items_spec["$ref"])
-                    if child_def:
-                        child_enum = self.get_enum(child_def)
-                        for i, item in enumerate(val):
-                            item_path = f"{full_path}[{i}]"
-                            if child_enum:
-                                inner = item.get("Value") if isinstance(item, dict) else item
-                                if inner is not None and inner not in child_enum:
-                                    issues.append(Issue("INVALID_ENUM", item_path,
-                                                        f"'{inner}' not in "
-                                                        f"{child_enum[:6]}..."))
-                            elif isinstance(item, dict):
-                                issues.extend(self.validate(item, child_def, item_path))
+        # Iterative walk: each frame is (obj, resolved definition, path)
+        stack = [(obj, resolved, path)]
+        while stack:
+            obj, resolved, path = stack.pop()
+            walk = self._compiled_fn.get(resolved) or self._compile_definition(resolved)
+            children = []
+            walk(obj, path, issues, children)
+            # Reversed so children are visited in document order
+            stack.extend(reversed(children))
 
         return issues
 
-    def _check_type(self, val, prop_spec, path):
-        """Check JSON value type matches schema expectation."""
-        issues = []
-        if val is None:
-            return issues
-
-        expected = prop_spec.get("type")
-        if not expected:
-            return issues
-
-        type_map = {
-            "string": str,
-            "boolean": bool,
-            "integer": int,
-            "number": (int, float),
-            "array": list,
-            "object": dict,
-        }
-
-        expected_types = type_map.get(expected)
-        if expected_types and not isinstance(val, expected_types):
-            if expected in ("integer", "number") and isinstance(val, bool):
-                issues.append(Issue("TYPE_MISMATCH", path,
-                                    f"expected {expected}, got boolean"))
-            else:
-                issues.append(Issue("TYPE_MISMATCH", path,
-                                    f"expected {expected}, got {type(val).__name__}"))
 
-        return issues
+# ── Issue tracking ──────────────────────────────────────────────────────────
 
+_BRACKET_RE = re.compile(r"\[\d+\]")
 
-# ── Issue tracking ──────────────────────────────────────────────────────────
 
 class Issue:
+    # Runs can create tens of thousands of issues; no per-instance __dict__
+    __slots__ = ("category", "path", "message", "_normalized_path")
+
     def __init__(self, category, path, message):
         self.category = category
         self.path = path
         self.message = message
+        self._normalized_path = _BRACKET_RE.sub("[*]", path) if "[" in path else path
 
     def __str__(self):
         return f"  {self.category} {self.path}: {self.message}"
 
     @property
     def normalized_path(self):
-        return re.sub(r"\[\d+\]", "[*]", self.path)
+        return self._normalized_path
 
 
 # ── Validation runner ───────────────────────────────────────────────────────
 
-def validate_files(validator, ti_def, files):
-    """Run validation across all files. Returns {filename: [issues]}."""
-    results = {}
-    for fpath in files:
-        try:
-            with open(fpath) as f:
-                doc = json.load(f)
-        except json.JSONDecodeError as e:
-            results[fpath.name] = [Issue("PARSE_ERROR", "", str(e))]
+def _validate_batch(targets, name, items):
+    """Validate the items of a batch file (JSON array) against each schema."""
+    entries = {key: [] for key in targets}
+    for idx, item in enumerate(items):
+        inner = item.get("DraftItem", item) if isinstance(item, dict) else item
+        ti = inner.get("TradeItem", inner) if isinstance(inner, dict) else inner
+        for key, (validator, ti_def) in targets.items():
+            item_issues = validator.validate(ti, ti_def, f"[{idx}].TradeItem")
+            if item_issues:
+                entries[key].append((f"{name}[{idx}]", item_issues))
+    return entries
+
+
+def _child_defs(targets):
+    """The CatalogueItemChildItemLink definition of each schema, if it has one."""
+    return {key: validator.resolve("CatalogueItemChildItemLink")
+            for key, (validator, _) in targets.items()}
+
+
+def _validate_child(targets, child_defs, idx, child, issues):
+    """Validate one CatalogueItemChildItemLink item, appending to issues ({key: [issues]})."""
+    child_path = f"CatalogueItemChildItemLink[{idx}]"
+    child_ti = child.get("CatalogueItem", {}).get("TradeItem")
+    for key, (validator, ti_def) in targets.items():
+        if not child_defs[key]:
             continue
+        issues[key].extend(validator.validate(child, child_defs[key], child_path))
+        if child_ti:
+            issues[key].extend(validator.validate(
+                child_ti, ti_def,
+                f"{child_path}.CatalogueItem.TradeItem"))
 
-        # Handle batch files (JSON array), DraftItem wrapper, or direct TradeItem
-        if isinstance(doc, list):
-            # Batch file — validate each item
-            for idx, item in enumerate(doc):
-                inner = item.get("DraftItem", item) if isinstance(item, dict) else item
-                ti = inner.get("TradeItem", inner) if isinstance(inner, dict) else inner
-                item_issues = validator.validate(ti, ti_def, f"[{idx}].TradeItem")
-                if item_issues:
-                    results[f"{fpath.name}[{idx}]"] = item_issues
-            continue
 
-        # Single document — unwrap DraftItem if present
-        inner = doc.get("DraftItem", doc)
-        trade_item = inner.get("TradeItem", inner)
+def _document_entries(targets, name, trade_item, child_issues):
+    """Validate a TradeItem and append the issues already found in its child links."""
+    entries = {}
+    for key, (validator, ti_def) in targets.items():
         issues = validator.validate(trade_item, ti_def, "TradeItem")
+        issues.extend(child_issues[key])
+        entries[key] = [(name, issues)]
+    return entries
+
+
+def _validate_document(targets, name, trade_item, children):
+    """Validate a TradeItem and its CatalogueItemChildItemLink children against each schema."""
+    child_defs = _child_defs(targets)
+    child_issues = {key: [] for key in targets}
+    if any(child_defs.values()):
+        for idx, child in enumerate(children):
+            _validate_child(targets, child_defs, idx, child, child_issues)
+    return _document_entries(targets, name, trade_item, child_issues)
+
+
+def _build_value(events, event, value):
+    """Assemble the JSON value that starts with (event, value) from ijson parse events."""
+    if event == "start_map":
+        root = {}
+    elif event == "start_array":
+        root = []
+    else:
+        return value
+    # Containers still open, innermost last; a map_key is always followed by its value
+    stack = [root]
+    key = None
+    for _, event, value in events:
+        if event == "map_key":
+            key = value
+            continue
+        if event == "end_map" or event == "end_array":
+            stack.pop()
+            if not stack:
+                return root
+            continue
+        if event == "start_map":
+            value = {}
+        elif event == "start_array":
+            value = []
+        top = stack[-1]
+        if type(top) is list:
+            top.append(value)
+        else:
+            top[key] = value
+        if event == "start_map" or event == "start_array":
+            stack.append(value)
+
+
+def _validate_streamed(targets, fpath):
+    """Validate a large file with ijson in one pass, one child link or batch item at a time.
+
+    Returns None for document shapes it does not handle (no TradeItem key),
+    in which case the caller falls back to loading the whole document.
+    """
+    child_defs = _child_defs(targets)
+    # Whether the document has a DraftItem wrapper is only certain once the
+    # top level has been read, so both layouts are collected along the way.
+    # Child links may precede the TradeItem; they are validated on arrival
+    # and only their issues are kept.
+    bases = ("", "DraftItem.")
+    trade_items = {}
+    child_prefixes = ({base + "CatalogueItemChildItemLink.item": base for base in bases}
+                      if any(child_defs.values()) else {})
+    child_issues = {base: {key: [] for key in targets} for base in bases}
+    child_counts = dict.fromkeys(bases, 0)
+    has_draft = False
+
+    with open(fpath, "rb") as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix == "":
+                if event == "start_array":
+                    # Only the first buffer has been read; let ijson build the
+                    # batch items natively from the start of the file
+                    f.seek(0)
+                    items = ijson.items(f, "item", use_float=True)
+                    return _validate_batch(targets, fpath.name, items)
+                if event == "map_key" and value == "DraftItem":
+                    has_draft = True
+            elif prefix == "TradeItem" or prefix == "DraftItem.TradeItem":
+                trade_items[prefix] = _build_value(events, event, value)
+                if prefix == "DraftItem.TradeItem" and not child_prefixes:
+                    break
+            elif prefix in child_prefixes:
+                base = child_prefixes[prefix]
+                child = _build_value(events, event, value)
+                _validate_child(targets, child_defs, child_counts[base], child,
+                                child_issues[base])
+                child_counts[base] += 1
+            elif prefix == "DraftItem" and event == "end_map":
+                # Nothing outside the wrapper is used
+                break
+
+    base = "DraftItem." if has_draft else ""
+    trade_item = trade_items.get(base + "TradeItem")
+    if trade_item is None:
+        return None
+    return _document_entries(targets, fpath.name, trade_item, child_issues[base])
 
-        # Also validate CatalogueItemChildItemLink children
-        children = inner.get("CatalogueItemChildItemLink", [])
-        child_def = validator.resolve("CatalogueItemChildItemLink")
-        if child_def and children:
-            for i, child in enumerate(children):
-                child_path = f"CatalogueItemChildItemLink[{i}]"
-                issues.extend(validator.validate(child, child_def, child_path))
-                child_ti = child.get("CatalogueItem", {}).get("TradeItem")
-                if child_ti:
-                    issues.extend(validator.validate(
-                        child_ti, ti_def,
-                        f"{child_path}.CatalogueItem.TradeItem"))
 
-        results[fpath.name] = issues
-    return results
+def validate_file(targets, fpath):
+    """Validate one file against each schema in targets ({key: (validator, ti_def)}).
+
+    The file is parsed once. Returns {key: [(result_name, [issues])]}.
+    """
+    if ijson is not None and fpath.stat().st_size > STREAM_THRESHOLD:
+        try:
+            entries = _validate_streamed(targets, fpath)
+        except ijson.JSONError as e:
+            issue = Issue("PARSE_ERROR", "", str(e).partition("\n")[0])
+            return {key: [(fpath.name, [issue])] for key in targets}
+        if entries is not None:
+            return entries
+
+    try:
+        with open(fpath, "rb") as f:
+            doc = _loads(f.read())
+    except json.JSONDecodeError as e:
+        issue = Issue("PARSE_ERROR", "", str(e))
+        return {key: [(fpath.name, [issue])] for key in targets}
+
+    # Handle batch files (JSON array), DraftItem wrapper, or direct TradeItem
+    if isinstance(doc, list):
+        return _validate_batch(targets, fpath.name, doc)
+
+    # Single document — unwrap DraftItem if present
+    inner = doc.get("DraftItem", doc)
+    trade_item = inner.get("TradeItem", inner)
+    children = inner.get("CatalogueItemChildItemLink") or []
+    return _validate_document(targets, fpath.name, trade_item, children)
+
+
+# Per-process {key: (validator, ti_def)}, set by the pool initializer
+_worker_targets = None
+
+
+def _init_worker(targets):
+    global _worker_targets
+    _worker_targets = targets
+
+
+def _validate_one_file(fpath):
+    return validate_file(_worker_targets, fpath)
+
+
+def validate_files(targets, files, jobs=None):
+    """Run validation across all files against each schema in targets.
+
+    Each file is parsed once and checked against every schema. Returns
+    {key: ({filename: [issues]}, Counter of (category, normalized path,
+    message) -> number of files affected)}. Files are independent, so they
+    are spread over `jobs` worker processes (default: one per CPU); the
+    validators are shipped to each worker once.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(files) > 1:
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(jobs, initializer=_init_worker,
+                                 initargs=(targets,)) as ex:
+            per_file = list(ex.map(_validate_one_file, files, chunksize=chunksize))
+    else:
+        per_file = [validate_file(targets, fpath) for fpath in files]
+
+    out = {key: ({}, collections.Counter()) for key in targets}
+    for file_entries in per_file:
+        for key, entries in file_entries.items():
+            results, patterns = out[key]
+            for name, issues in entries:
+                results[name] = issues
+                # Aggregate unique issue patterns (once per file)
+                seen = set()
+                for iss in issues:
+                    pattern = (iss.category, iss.normalized_path, iss.message)
+                    if pattern not in seen:
+                        patterns[pattern] += 1
+                        seen.add(pattern)
+    return out
 
 
 # ── Output formatting ──────────────────────────────────────────────────────
 
-def print_summary(label, results, verbose=False):
+def print_summary(label, results, patterns, verbose=False):
     """Print validation summary for one schema."""
     total = len(results)
     valid = sum(1 for r in results.values() if not r)
@@ -279,22 +724,12 @@ def print_summary(label, results, verbose=False):
             for iss in issues:
                 print(f"  {iss}")
 
-    # Aggregate unique issue patterns
-    all_patterns = collections.Counter()
-    for issues in results.values():
-        seen = set()
-        for iss in issues:
-            key = f"{iss.category} {iss.normalized_path}: {iss.message}"
-            if key not in seen:
-                all_patterns[key] += 1
-                seen.add(key)
-
-    if all_patterns:
+    if patterns:
         print(f"\n{'─' * 66}")
         print(f"ISSUE PATTERNS (unique path + message, count = files affected):")
         print(f"{'─' * 66}")
-        for pattern, count in all_patterns.most_common(50):
-            print(f"  {count:4d}x  {pattern}")
+        for (category, path, message), count in patterns.most_common(50):
+            print(f"  {count:4d}x  {category} {path}: {message}")
     else:
         print(f"\nAll {total} files passed validation.")
 
@@ -305,7 +740,7 @@ def dump_schema(specs, name):
     """Print a schema definition from all loaded specs."""
     for key, spec in specs.items():
         label = SCHEMAS[key]["label"]
-        index = build_schema_index(spec)
+        index, _ = build_schema_index(spec)
         full = index.get(name) or name
         d = spec["definitions"].get(full)
         if d:
@@ -328,20 +763,29 @@ def main():
     verbose = "--verbose" in args or "-v" in args
     args = [a for a in args if a not in ("--verbose", "-v")]
 
-    # Refresh cache
+    # Worker processes (default: one per CPU)
+    jobs = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        try:
+            jobs = int(args[i + 1])
+        except (IndexError, ValueError):
+            jobs = 0
+        if jobs < 1:
+            print("Usage: --jobs <N>")
+            sys.exit(1)
+        del args[i:i + 2]
+
+    # Revalidate cached specs against the server
     refresh = "--refresh" in args
     if refresh:
         args.remove("--refresh")
-        for info in SCHEMAS.values():
-            cache = Path(__file__).parent / info["cache"]
-            if cache.exists():
-                cache.unlink()
 
     # Dump schema mode
     if args and args[0] == "--dump-schema":
         specs = {}
         for key in SCHEMAS:
-            specs[key] = fetch_swagger(key)
+            specs[key] = fetch_swagger(key, use_cache=not refresh)
         if len(args) > 1:
             dump_schema(specs, args[1])
         else:
@@ -349,47 +793,47 @@ def main():
         return
 
     # Load both schemas
-    all_success = True
-    files = None
-
-    for schema_key in SCHEMAS:
-        info = SCHEMAS[schema_key]
-        spec = fetch_swagger(schema_key)
+    targets = {}
+    for schema_key, info in SCHEMAS.items():
+        spec = fetch_swagger(schema_key, use_cache=not refresh)
         validator = Validator(spec, info["label"])
         n_defs = len(spec["definitions"])
 
         # Find TradeItem definition
-        ti_def = None
-        for name in spec["definitions"]:
-            if name.endswith(".TradeItem") and "Standard" in name:
-                ti_def = name
-                break
-        if not ti_def:
-            print(f"ERROR: TradeItem not found in {info['label']}")
+        candidates = validator.standard_index.get("TradeItem", [])
+        if len(candidates) != 1:
+            if candidates:
+                print(f"ERROR: multiple Standard TradeItem definitions in {info['label']}: "
+                      f"{', '.join(candidates)}")
+            else:
+                print(f"ERROR: TradeItem not found in {info['label']}")
             sys.exit(1)
+        ti_def = candidates[0]
 
         n_props = len(validator.get_props(ti_def))
         print(f"{info['label']}: {n_defs} definitions, TradeItem has {n_props} properties")
+        targets[schema_key] = (validator, ti_def)
 
-        # Collect files (once)
-        if files is None:
-            json_args = [a for a in args if a.endswith(".json")]
-            if json_args:
-                files = [Path(a) for a in json_args]
-            else:
-                if not FIRSTBASE_DIR.exists():
-                    print(f"ERROR: {FIRSTBASE_DIR} not found.")
-                    sys.exit(1)
-                files = sorted(FIRSTBASE_DIR.glob("*.json"))
+    # Collect files
+    json_args = [a for a in args if a.endswith(".json")]
+    if json_args:
+        files = [Path(a) for a in json_args]
+    else:
+        if not FIRSTBASE_DIR.exists():
+            print(f"ERROR: {FIRSTBASE_DIR} not found.")
+            sys.exit(1)
+        files = sorted(FIRSTBASE_DIR.glob("*.json"))
 
-            if not files:
-                print("No JSON files to validate.")
-                sys.exit(1)
+    if not files:
+        print("No JSON files to validate.")
+        sys.exit(1)
 
-            print(f"Validating {len(files)} files...\n")
+    print(f"Validating {len(files)} files...\n")
 
-        results = validate_files(validator, ti_def, files)
-        success = print_summary(info["label"], results, verbose)
+    # Each file is parsed once and checked against both schemas
+    all_success = True
+    for schema_key, (results, patterns) in validate_files(targets, files, jobs).items():
+        success = print_summary(SCHEMAS[schema_key]["label"], results, patterns, verbose)
         if not success:
             all_success = False
 